@@ -1,5 +1,132 @@
-from django.contrib import admin
+from django.contrib import admin, messages
 from django.apps import apps
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils import timezone
+from django.utils.functional import cached_property
+from api.models import UserModel, EmailOTPModel
+
+ADMIN_CHUNK_SIZE = 5000
+
+
+class EstimatedCountPaginator(Paginator):
+    """Use the planner's row estimate for unfiltered changelists on PostgreSQL."""
+
+    @cached_property
+    def count(self):
+        query = self.object_list.query
+        connection = connections[self.object_list.db]
+        if connection.vendor == "postgresql" and not query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                    [connection.ops.quote_name(self.object_list.model._meta.db_table)],
+                )
+                row = cursor.fetchone()
+            if row and row[0] > 0:
+                return row[0]
+        return super().count
+
+
+def chunked_pks(queryset, chunk_size=ADMIN_CHUNK_SIZE):
+    pks = queryset.order_by().values_list("pk", flat=True)
+    chunk = []
+    for pk in pks.iterator(chunk_size=chunk_size):
+        chunk.append(pk)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def normalized_emails(search_term):
+    # Register lowercases the whole address, CustomUserManager only the domain.
+    email = UserModel.objects.normalize_email(search_term)
+    return {email, email.lower()}
+
+
+class ScalableModelAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    list_per_page = 50
+
+    def get_actions(self, request):
+        # delete_selected builds the whole get_deleted_objects() tree in
+        # memory; the chunked purge actions replace it.
+        actions = super().get_actions(request)
+        actions.pop("delete_selected", None)
+        return actions
+
+
+@admin.register(UserModel)
+class UserModelAdmin(ScalableModelAdmin):
+    list_display = ("email", "username", "is_active", "is_staff", "created_at")
+    list_filter = ("is_active", "is_staff")
+    # search_fields only enables the search box; get_search_results below
+    # decides how the term is matched.
+    search_fields = ("email", "username")
+    search_help_text = (
+        "Exact email address, or the start of a username (case-sensitive)."
+    )
+    ordering = ("-created_at",)
+    readonly_fields = ("created_at", "last_login")
+    actions = ("activate_users", "purge_inactive_users")
+
+    def get_search_results(self, request, queryset, search_term):
+        # Case-sensitive exact/prefix lookups so the email unique index and
+        # the username index (plus their varchar_pattern_ops "_like"
+        # companions on PostgreSQL) can serve the query; iexact/istartswith
+        # compile to UPPER(col) and would fall back to a sequential scan.
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset, False
+        if "@" in search_term:
+            return queryset.filter(email__in=normalized_emails(search_term)), False
+        return queryset.filter(username__startswith=search_term), False
+
+    @admin.action(description="Activate selected users", permissions=["change"])
+    def activate_users(self, request, queryset):
+        updated = 0
+        for chunk in chunked_pks(queryset.filter(is_active=False)):
+            updated += UserModel.objects.filter(pk__in=chunk).update(is_active=True)
+        self.message_user(request, f"{updated} user(s) activated.", messages.SUCCESS)
+
+    @admin.action(description="Purge selected inactive users", permissions=["delete"])
+    def purge_inactive_users(self, request, queryset):
+        deleted = 0
+        for chunk in chunked_pks(queryset.filter(is_active=False)):
+            users = UserModel.objects.filter(pk__in=chunk)
+            self.log_deletions(request, users)
+            deleted += users.delete()[1].get(UserModel._meta.label, 0)
+        self.message_user(request, f"{deleted} user(s) purged.", messages.SUCCESS)
+
+
+@admin.register(EmailOTPModel)
+class EmailOTPModelAdmin(ScalableModelAdmin):
+    list_display = ("user", "code", "created_at", "expires_at")
+    list_select_related = ("user",)
+    search_fields = ("user__email",)
+    search_help_text = "Exact email address of the user."
+    ordering = ("-created_at",)
+    raw_id_fields = ("user",)
+    actions = ("purge_expired_otps",)
+
+    def get_search_results(self, request, queryset, search_term):
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset, False
+        return queryset.filter(user__email__in=normalized_emails(search_term)), False
+
+    @admin.action(description="Purge selected expired OTPs", permissions=["delete"])
+    def purge_expired_otps(self, request, queryset):
+        deleted = 0
+        for chunk in chunked_pks(queryset.filter(expires_at__lte=timezone.now())):
+            otps = EmailOTPModel.objects.filter(pk__in=chunk)
+            self.log_deletions(request, otps)
+            deleted += otps.delete()[0]
+        self.message_user(request, f"{deleted} OTP(s) purged.", messages.SUCCESS)
+
 
 app_models = apps.get_app_config("api").get_models()
 
@@ -0,0 +1,99 @@
+import time
+import uuid
+
+from django.conf import settings
+from django.contrib import admin
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import RequestFactory
+
+from api.admin import chunked_pks
+from api.models import UserModel
+
+BENCH_DOMAIN = "bench.invalid"
+
+
+class Command(BaseCommand):
+    help = "Seed throwaway users and time the UserModel admin changelist."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=1_000_000)
+        parser.add_argument("--runs", type=int, default=5)
+        parser.add_argument("--batch-size", type=int, default=10_000)
+        parser.add_argument(
+            "--keep", action="store_true", help="Keep the seeded users afterwards."
+        )
+
+    def handle(self, *args, **options):
+        database = connection.settings_dict["NAME"]
+        if connection.vendor == "sqlite" and str(database) == str(
+            settings.BASE_DIR / "db.sqlite3"
+        ):
+            raise CommandError(
+                "Refusing to seed the tracked development database "
+                f"({database}). Point DATABASES['default'] at a scratch "
+                "database before running this benchmark."
+            )
+
+        superuser = UserModel(
+            username="bench-admin",
+            email=f"admin-{uuid.uuid4().hex}@{BENCH_DOMAIN}",
+            is_staff=True,
+            is_superuser=True,
+            is_active=True,
+        )
+        superuser.set_unusable_password()
+
+        try:
+            self.seed(options["users"], options["batch_size"])
+            if connection.vendor == "postgresql":
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        f"ANALYZE {connection.ops.quote_name(UserModel._meta.db_table)}"
+                    )
+            superuser.save()
+
+            model_admin = admin.site._registry[UserModel]
+            factory = RequestFactory()
+            for label, params in (
+                ("changelist", {}),
+                ("search email", {"q": f"user-1@{BENCH_DOMAIN}"}),
+                ("search username", {"q": "bench-user-12"}),
+            ):
+                timings = []
+                for _ in range(options["runs"]):
+                    request = factory.get("/admin/api/usermodel/", params, HTTP_HOST="localhost")
+                    request.user = superuser
+                    start = time.perf_counter()
+                    model_admin.changelist_view(request).render()
+                    timings.append(time.perf_counter() - start)
+                timings.sort()
+                self.stdout.write(
+                    f"{label}: best {timings[0] * 1000:.1f} ms, "
+                    f"median {timings[len(timings) // 2] * 1000:.1f} ms"
+                )
+        finally:
+            UserModel.objects.filter(pk=superuser.pk).delete()
+            if not options["keep"]:
+                self.purge(options["batch_size"])
+
+    def seed(self, total, batch_size):
+        existing = UserModel.objects.filter(email__endswith=f"@{BENCH_DOMAIN}").count()
+        start = time.perf_counter()
+        for offset in range(existing, total, batch_size):
+            UserModel.objects.bulk_create(
+                UserModel(
+                    username=f"bench-user-{i}",
+                    email=f"user-{i}@{BENCH_DOMAIN}",
+                    password="!",
+                )
+                for i in range(offset, min(offset + batch_size, total))
+            )
+        self.stdout.write(
+            f"seeded {max(total - existing, 0)} users in {time.perf_counter() - start:.1f} s"
+        )
+
+    def purge(self, batch_size):
+        seeded = UserModel.objects.filter(email__endswith=f"@{BENCH_DOMAIN}")
+        for chunk in chunked_pks(seeded, batch_size):
+            UserModel.objects.filter(pk__in=chunk).delete()
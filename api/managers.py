@@ -1,24 +1,23 @@
 from django.contrib.auth.base_user import BaseUserManager
-from django.core.exceptions import ValidationError
-from django.core.validators import validate_email
 from django.utils.translation import gettext_lazy as _
+from helpers.validator import check_email
 
 class CustomUserManager(BaseUserManager):
 
     def email_validator(self,email):
-        try:
-            validate_email(email)
-        except ValidationError:
-            raise ValueError(_("You must provide a valid email"))
+        email_error = check_email(email)
+        if email_error:
+            raise ValueError(email_error)
         
-    def create_user(self,username,email,password,**extra_fields):
+    def create_user(self,username,email,password,email_checked=False,**extra_fields):
 
         if not username:
             raise ValueError(_("Users must submit username"))
         
         if email:
             email = self.normalize_email(email)
-            self.email_validator(email)
+            if not email_checked:
+                self.email_validator(email)
         else:
             raise ValueError(_("Base User: an email address is required"))
         
@@ -50,10 +49,7 @@ class CustomUserManager(BaseUserManager):
         if not password:
             raise ValueError(_("Superusers must have a password"))
 
-        if email:
-            email = self.normalize_email(email)
-            self.email_validator(email)
-        else:
+        if not email:
             raise ValueError(_("Admin User: an email address is required"))
         
         user = self.create_user(username,email,password,**extra_fields)
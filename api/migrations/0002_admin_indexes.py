@@ -0,0 +1,24 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='usermodel',
+            name='username',
+            field=models.CharField(db_index=True, max_length=100),
+        ),
+        migrations.AddIndex(
+            model_name='usermodel',
+            index=models.Index(fields=['-created_at'], name='api_user_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='emailotpmodel',
+            index=models.Index(fields=['-created_at'], name='api_otp_created_idx'),
+        ),
+    ]
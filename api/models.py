@@ -11,7 +11,7 @@ import datetime
 
 class UserModel(AbstractBaseUser, PermissionsMixin):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    username = models.CharField(max_length=100)
+    username = models.CharField(max_length=100, db_index=True)
     email = models.EmailField(max_length=254, unique=True)
     profile = models.ImageField(upload_to="profile", null=True, blank=True)
     is_staff = models.BooleanField(default=False)
@@ -26,6 +26,9 @@ class UserModel(AbstractBaseUser, PermissionsMixin):
     class Meta:
         verbose_name = "User"
         verbose_name_plural = "Users"
+        indexes = [
+            models.Index(fields=["-created_at"], name="api_user_created_idx"),
+        ]
 
     def __str__(self):
         return self.email
@@ -37,6 +40,11 @@ class EmailOTPModel(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     expires_at = models.DateTimeField()
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["-created_at"], name="api_otp_created_idx"),
+        ]
+
     def is_expired(self):
         return timezone.now() > self.expires_at
 
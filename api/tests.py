@@ -1,3 +1,304 @@
-from django.test import TestCase
+import datetime
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.admin.models import DELETION, LogEntry
+from django.contrib.admin.sites import site
+from django.contrib.auth.models import Permission
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.core.management import CommandError, call_command
+from django.test import RequestFactory, SimpleTestCase, TestCase
+from django.utils import timezone
+
+from api.admin import EstimatedCountPaginator, chunked_pks
+from api.models import EmailOTPModel, UserModel
+from api.views import register
+from helpers import validator
+
+
+class AdminTestCase(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.superuser = UserModel.objects.create_superuser(
+            "admin", "admin@example.com", "password123"
+        )
+
+    def make_request(self, user=None, data=None):
+        request = self.factory.post("/admin/", data or {})
+        request.user = user or self.superuser
+        request.session = {}
+        request._messages = FallbackStorage(request)
+        return request
+
+    def messages(self, request):
+        return [str(m) for m in request._messages]
+
+    def make_users(self, count, is_active=False):
+        return UserModel.objects.bulk_create(
+            UserModel(username=f"user{i}", email=f"user{i}@example.com", is_active=is_active)
+            for i in range(count)
+        )
+
+
+class EstimatedCountPaginatorTests(AdminTestCase):
+    def test_falls_back_to_exact_count_off_postgresql(self):
+        self.make_users(7)
+        paginator = EstimatedCountPaginator(UserModel.objects.order_by("pk"), 5)
+        self.assertEqual(paginator.count, 8)
+        self.assertEqual(paginator.num_pages, 2)
+
+    def test_filtered_queryset_uses_exact_count(self):
+        self.make_users(3)
+        paginator = EstimatedCountPaginator(
+            UserModel.objects.filter(is_active=False).order_by("pk"), 5
+        )
+        self.assertEqual(paginator.count, 3)
+
+
+class ChunkedPksTests(AdminTestCase):
+    def test_yields_every_pk_in_bounded_chunks(self):
+        self.make_users(5)
+        chunks = list(chunked_pks(UserModel.objects.all(), chunk_size=2))
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 2])
+        self.assertEqual(
+            {pk for chunk in chunks for pk in chunk},
+            set(UserModel.objects.values_list("pk", flat=True)),
+        )
+
+
+class UserModelAdminTests(AdminTestCase):
+    def setUp(self):
+        super().setUp()
+        self.model_admin = site._registry[UserModel]
+
+    def test_activate_users_updates_inactive_rows(self):
+        self.make_users(5)
+        request = self.make_request()
+        self.model_admin.activate_users(request, UserModel.objects.all())
+        self.assertFalse(UserModel.objects.filter(is_active=False).exists())
+        self.assertEqual(self.messages(request), ["5 user(s) activated."])
+
+    def test_purge_inactive_users_deletes_users_otps_and_logs(self):
+        users = self.make_users(3)
+        EmailOTPModel.objects.create(user=users[0], code="123456")
+        request = self.make_request()
+        self.model_admin.purge_inactive_users(request, UserModel.objects.all())
+        self.assertEqual(list(UserModel.objects.all()), [self.superuser])
+        self.assertFalse(EmailOTPModel.objects.exists())
+        self.assertEqual(self.messages(request), ["3 user(s) purged."])
+        self.assertEqual(LogEntry.objects.filter(action_flag=DELETION).count(), 3)
+
+    def test_actions_require_matching_permissions(self):
+        staff = UserModel.objects.create_user(
+            "staff", "staff@example.com", "password123", is_staff=True, is_active=True
+        )
+        staff.user_permissions.add(Permission.objects.get(codename="view_usermodel"))
+        actions = self.model_admin.get_actions(self.make_request(user=staff))
+        self.assertNotIn("activate_users", actions)
+        self.assertNotIn("purge_inactive_users", actions)
+
+        staff.user_permissions.add(Permission.objects.get(codename="change_usermodel"))
+        staff = UserModel.objects.get(pk=staff.pk)
+        actions = self.model_admin.get_actions(self.make_request(user=staff))
+        self.assertIn("activate_users", actions)
+        self.assertNotIn("purge_inactive_users", actions)
+
+    def test_delete_selected_is_replaced_by_chunked_purge(self):
+        actions = self.model_admin.get_actions(self.make_request())
+        self.assertNotIn("delete_selected", actions)
+        self.assertIn("purge_inactive_users", actions)
+        otp_actions = site._registry[EmailOTPModel].get_actions(self.make_request())
+        self.assertEqual(list(otp_actions), ["purge_expired_otps"])
+
+    def test_search_matches_exact_email_and_username_prefix(self):
+        self.make_users(12)
+        request = self.make_request()
+        queryset, _ = self.model_admin.get_search_results(
+            request, UserModel.objects.all(), " USER1@example.com "
+        )
+        self.assertEqual([u.username for u in queryset], ["user1"])
+        queryset, _ = self.model_admin.get_search_results(
+            request, UserModel.objects.all(), "user1@example"
+        )
+        self.assertEqual(list(queryset), [])
+        queryset, _ = self.model_admin.get_search_results(
+            request, UserModel.objects.all(), "user1"
+        )
+        self.assertEqual(
+            sorted(u.username for u in queryset), ["user1", "user10", "user11"]
+        )
+
+    def test_search_matches_stored_local_part_case(self):
+        user = UserModel.objects.create_user("john", "John@Example.COM", "password123")
+        self.assertEqual(user.email, "John@example.com")
+        queryset, _ = self.model_admin.get_search_results(
+            self.make_request(), UserModel.objects.all(), "John@EXAMPLE.com"
+        )
+        self.assertEqual(list(queryset), [user])
+
+
+class BenchmarkAdminChangelistTests(TestCase):
+    def test_refuses_tracked_development_database(self):
+        with mock.patch.dict(
+            "django.db.connection.settings_dict",
+            {"NAME": settings.BASE_DIR / "db.sqlite3"},
+        ):
+            with self.assertRaisesMessage(CommandError, "Refusing to seed"):
+                call_command("benchmark_admin_changelist", users=10, runs=1)
+        self.assertFalse(UserModel.objects.exists())
+
+    def test_times_changelist_and_cleans_up(self):
+        out = StringIO()
+        call_command("benchmark_admin_changelist", users=30, runs=1, stdout=out)
+        self.assertIn("seeded 30 users", out.getvalue())
+        self.assertIn("search username:", out.getvalue())
+        self.assertFalse(UserModel.objects.exists())
+
+
+class EmailOTPModelAdminTests(AdminTestCase):
+    def test_purge_expired_otps_only_removes_expired_rows(self):
+        user = self.make_users(1)[0]
+        now = timezone.now()
+        EmailOTPModel.objects.create(
+            user=user, code="111111", expires_at=now - datetime.timedelta(minutes=1)
+        )
+        fresh = EmailOTPModel.objects.create(
+            user=user, code="222222", expires_at=now + datetime.timedelta(minutes=10)
+        )
+        request = self.make_request()
+        site._registry[EmailOTPModel].purge_expired_otps(
+            request, EmailOTPModel.objects.all()
+        )
+        self.assertEqual(list(EmailOTPModel.objects.all()), [fresh])
+        self.assertEqual(self.messages(request), ["1 OTP(s) purged."])
+        self.assertEqual(LogEntry.objects.filter(action_flag=DELETION).count(), 1)
+
+
+class ValidateEmailTests(SimpleTestCase):
+    def test_accepts_valid_addresses(self):
+        for email in (
+            "a@b.co",
+            "first.last+tag@mail.example.com",
+            "user@xn--bcher-kva.ch",
+            "user@b\u00fccher.ch",
+        ):
+            with self.subTest(email=email):
+                self.assertTrue(validator.validate_email(email))
+
+    def test_rejects_malformed_addresses(self):
+        for email in (
+            "",
+            "a@b.com\n",
+            "a@-..com",
+            ".a@b..c",
+            "a..b@example.com",
+            "a@example",
+            "a@exa_mple.com",
+            "@example.com",
+            "example.com",
+            "a@" + "a" * 250 + ".com",
+        ):
+            with self.subTest(email=email):
+                self.assertFalse(validator.validate_email(email))
+
+    def test_check_email_messages(self):
+        self.assertIsNone(validator.check_email("user@example.com"))
+        self.assertEqual(validator.check_email("nope"), "Invalid email format")
+        self.assertEqual(
+            validator.check_email("user@mailinator.com"),
+            "Disposable email addresses are not allowed",
+        )
+
+
+class DisposableEmailTests(SimpleTestCase):
+    def test_matches_listed_domain_and_subdomains(self):
+        self.assertTrue(validator.is_disposable_email("a@mailinator.com"))
+        self.assertTrue(validator.is_disposable_email("a@x.y.mailinator.com"))
+
+    def test_normalises_case_and_trailing_dot(self):
+        self.assertTrue(validator.is_disposable_email("A@MailInator.COM"))
+        self.assertTrue(validator.is_disposable_email("a@mailinator.com."))
+
+    def test_does_not_match_partial_domains(self):
+        blocklist = frozenset({"mailinator.com"})
+        for email in ("a@notmailinator.com", "a@mailinator.com.example.org", "a@gmail.com"):
+            with self.subTest(email=email):
+                self.assertFalse(validator.is_disposable_email(email, blocklist))
+
+    def test_address_without_at_checks_whole_string(self):
+        self.assertTrue(validator.is_disposable_email("mailinator.com"))
+        self.assertFalse(validator.is_disposable_email("not-an-email"))
+
+    def test_custom_blocklist(self):
+        blocklist = frozenset(f"d{i}.example" for i in range(100_000))
+        self.assertTrue(validator.is_disposable_email("a@mx.d99999.example", blocklist))
+        self.assertFalse(validator.is_disposable_email("a@d100000.example", blocklist))
+
+    def test_blocklist_loader_skips_comments_and_blank_lines(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            upstream = Path(tmp) / "upstream.txt"
+            upstream.write_text("# header\n  # indented\n\n  Spam.Example \n")
+            local = Path(tmp) / "local.txt"
+            local.write_text("# local\nother.example\n")
+            validator.load_disposable_domains.cache_clear()
+            self.addCleanup(validator.load_disposable_domains.cache_clear)
+            with mock.patch.object(
+                validator, "DISPOSABLE_DOMAINS_FILES", (upstream, local)
+            ):
+                self.assertEqual(
+                    validator.load_disposable_domains(),
+                    frozenset({"spam.example", "other.example"}),
+                )
+
+    def test_bundled_blocklist_covers_upstream_and_local_entries(self):
+        domains = validator.load_disposable_domains()
+        self.assertGreater(len(domains), 9000)
+        self.assertIn("yopmail.com", domains)
+        self.assertIn("tempmail.dev", domains)
+        self.assertFalse(any(domain.startswith("#") for domain in domains))
+        self.assertNotIn("gmail.com", domains)
+
+
+class RegisterTests(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        patcher = mock.patch("api.views.send_otp_email")
+        self.send_otp_email = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def post(self, email):
+        request = self.factory.post(
+            "/api/register/",
+            {"username": "reader", "email": email, "password": "password123"},
+            format="json",
+        )
+        return register(request)
+
+    def test_validates_email_once(self):
+        with mock.patch(
+            "api.views.check_email", wraps=validator.check_email
+        ) as view_check, mock.patch("api.managers.check_email") as manager_check:
+            response = self.post("reader@example.com")
+        self.assertEqual(response.status_code, 200)
+        view_check.assert_called_once_with("reader@example.com")
+        manager_check.assert_not_called()
+        self.assertTrue(UserModel.objects.filter(email="reader@example.com").exists())
+
+    def test_rejects_disposable_email_before_resending_otp(self):
+        UserModel.objects.bulk_create(
+            [UserModel(username="reader", email="reader@mailinator.com")]
+        )
+        response = self.post("reader@mailinator.com")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.data["message"], "Disposable email addresses are not allowed"
+        )
+        self.send_otp_email.assert_not_called()
+
+    def test_manager_rejects_invalid_and_disposable_email(self):
+        for email in ("a@-..com", ".a@b..c", "a@mailinator.com"):
+            with self.subTest(email=email), self.assertRaises(ValueError):
+                UserModel.objects.create_user("reader", email, "password123")
@@ -8,7 +8,7 @@ from django.utils import timezone
 import datetime
 from api.models import UserModel, EmailOTPModel
 from utils.otp import send_otp_email, generate_otp
-from helpers.validator import validate_email, validate_password
+from helpers.validator import check_email, validate_password
 
 
 # ======================================================
@@ -37,9 +37,10 @@ def register(request):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        if not validate_email(email):
+        email_error = check_email(email)
+        if email_error:
             return Response(
-                {"success": False, "message": "Invalid email format"},
+                {"success": False, "message": email_error},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
@@ -80,6 +81,7 @@ def register(request):
             username=username,
             email=email,
             password=password,
+            email_checked=True,
         )
         user.is_active = False
         user.save()
@@ -1,9 +1,73 @@
 import re
+from functools import lru_cache
+from pathlib import Path
+
+from django.utils.translation import gettext_lazy as _
+
+EMAIL_MAX_LENGTH = 254
+# Dot-atom local part and hostname rules from django.core.validators.EmailValidator
+# (quoted local parts and IP literals are rejected outright).
+EMAIL_USER_PATTERN = re.compile(
+    r"[-!#$%&'*+/=?^_`{}|~0-9A-Z]+(?:\.[-!#$%&'*+/=?^_`{}|~0-9A-Z]+)*",
+    re.IGNORECASE,
+)
+EMAIL_DOMAIN_PATTERN = re.compile(
+    r"(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+(?:[A-Z]{2,63}|xn--[A-Z0-9]{1,59})",
+    re.IGNORECASE,
+)
+DATA_DIR = Path(__file__).resolve().parent / "data"
+DISPOSABLE_DOMAINS_FILES = (
+    DATA_DIR / "disposable_domains.txt",
+    DATA_DIR / "local_disposable_domains.txt",
+)
+
+
+@lru_cache(maxsize=1)
+def load_disposable_domains():
+    domains = set()
+    for path in DISPOSABLE_DOMAINS_FILES:
+        with open(path, encoding="utf-8") as f:
+            lines = (line.strip() for line in f)
+            domains.update(
+                line.lower() for line in lines if line and not line.startswith("#")
+            )
+    return frozenset(domains)
 
 
 def validate_email(email):
-    pattern = r"^[\w\.-]+@[\w\.-]+\.\w+$"
-    return re.match(pattern, email)
+    if not email or len(email) > EMAIL_MAX_LENGTH:
+        return False
+    user, _, domain = email.rpartition("@")
+    if not user or not EMAIL_USER_PATTERN.fullmatch(user):
+        return False
+    if EMAIL_DOMAIN_PATTERN.fullmatch(domain):
+        return True
+    try:
+        domain = domain.encode("idna").decode("ascii")
+    except UnicodeError:
+        return False
+    return EMAIL_DOMAIN_PATTERN.fullmatch(domain) is not None
+
+
+def is_disposable_email(email, blocklist=None):
+    domain = email.rpartition("@")[2].lower().rstrip(".")
+    if blocklist is None:
+        blocklist = load_disposable_domains()
+    # Check the domain and each parent suffix, e.g. a.b.mailinator.com
+    # -> b.mailinator.com -> mailinator.com.
+    while domain:
+        if domain in blocklist:
+            return True
+        domain = domain.partition(".")[2]
+    return False
+
+
+def check_email(email):
+    if not validate_email(email):
+        return _("Invalid email format")
+    if is_disposable_email(email):
+        return _("Disposable email addresses are not allowed")
+    return None
 
 
 def validate_password(password):